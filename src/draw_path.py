@@ -0,0 +1,223 @@
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pygame
+
+from lib.path_sender import PathCommandSender, Point
+
+
+CANVAS_BG = (255, 255, 255)
+PATH_COLOR = (20, 90, 200)
+ERASE_PREVIEW = (230, 80, 80)
+INFO_BG = (40, 40, 40)
+INFO_TEXT = (230, 230, 230)
+PATH_WIDTH = 3
+# Long polylines are stroked in slices of this many segments; single huge
+# draw.lines calls slow down superlinearly on some backends (macOS/Quartz).
+LINES_CHUNK = 100
+
+
+class SimpleDraw:
+    def __init__(self, sender: Optional[PathCommandSender] = None, size: Tuple[int, int] = (960, 720)):
+        pygame.init()
+        try:
+            self.screen = pygame.display.set_mode(size, pygame.SCALED, vsync=1)
+        except pygame.error:
+            # Some drivers refuse vsync; fall back to a plain window.
+            self.screen = pygame.display.set_mode(size)
+        pygame.display.set_caption(
+            "Draw path with LMB. Space: send path. E: toggle eraser. C: clear."
+        )
+        self.canvas = pygame.Surface(size)
+        self.canvas.fill(CANVAS_BG)
+        self.font = pygame.font.Font(None, 24)
+
+        self.points: List[Point] = []
+        # Mirror of ``points`` used for vectorized hit-testing; grown geometrically.
+        self._points_arr = np.empty((1024, 2), dtype=np.int32)
+        self._len = 0
+        # Points of the current stroke not yet stroked onto the canvas; the
+        # last one is kept after a flush so the next segment connects to it.
+        self._pending: List[Point] = []
+        self._drawing = False
+        self._running = True
+        self.eraser_enabled = False
+        self.eraser_radius = 14
+        # Eraser motion is coalesced to the last position seen each frame.
+        self._pending_erase: Optional[Point] = None
+        self.sender = sender
+        # Set whenever the window content changes; the frame is only redrawn
+        # and flipped when this is True.
+        self._dirty = True
+
+        self.size = size
+
+    def _render_text(self) -> None:
+        info_lines = [
+            "LMB drag to draw path",
+            "Space: send/fly | C: clear | E: toggle eraser | Esc/Close: quit",
+            f"Eraser: {'ON' if self.eraser_enabled else 'OFF'} (radius {self.eraser_radius}px)",
+            f"Points: {len(self.points)}",
+        ]
+        info_height = 70
+        info_rect = pygame.Rect(0, 0, self.size[0], info_height)
+        pygame.draw.rect(self.screen, INFO_BG, info_rect)
+
+        y = 8
+        for line in info_lines:
+            text_surf = self.font.render(line, True, INFO_TEXT)
+            self.screen.blit(text_surf, (10, y))
+            y += 18
+
+    def _redraw_canvas(self, area: Optional[pygame.Rect] = None) -> None:
+        # Restricting to ``area`` keeps pixels outside it untouched; the path is
+        # still drawn in a single call and pygame clips it C-side.
+        self.canvas.set_clip(area)
+        self.canvas.fill(CANVAS_BG)
+        self._draw_polyline(self.points)
+        self.canvas.set_clip(None)
+
+    def _draw_polyline(self, points: List[Point]) -> None:
+        # Consecutive slices share their end point so the stroke stays joined.
+        for i in range(0, len(points) - 1, LINES_CHUNK):
+            pygame.draw.lines(self.canvas, PATH_COLOR, False, points[i : i + LINES_CHUNK + 1], PATH_WIDTH)
+
+    def _flush_pending(self) -> None:
+        if len(self._pending) >= 2:
+            self._draw_polyline(self._pending)
+            self._pending = self._pending[-1:]
+
+    def _end_stroke(self) -> None:
+        self._flush_pending()
+        self._pending = []
+
+    def _add_point(self, pos: Point) -> None:
+        self._pending.append(pos)
+        self.points.append(pos)
+        if self._len == len(self._points_arr):
+            grown = np.empty((2 * len(self._points_arr), 2), dtype=np.int32)
+            grown[: self._len] = self._points_arr
+            self._points_arr = grown
+        self._points_arr[self._len] = pos
+        self._len += 1
+        self._dirty = True
+
+    def _erase_at(self, pos: Point) -> None:
+        px, py = pos
+        arr = self._points_arr[: self._len]
+        # Squared distances avoid a sqrt per point.
+        d2 = (arr[:, 0] - px) ** 2 + (arr[:, 1] - py) ** 2
+        keep = d2 > self.eraser_radius * self.eraser_radius
+        new_len = int(np.count_nonzero(keep))
+        if new_len == self._len:
+            return
+
+        # Only segments touching a removed point change: the old ones through
+        # it disappear and its kept neighbours get joined directly.
+        removed = np.flatnonzero(~keep)
+        affected = arr[max(int(removed[0]) - 1, 0) : int(removed[-1]) + 2]
+        x_min, y_min = affected.min(axis=0).tolist()
+        x_max, y_max = affected.max(axis=0).tolist()
+        area = pygame.Rect(x_min, y_min, x_max - x_min + 1, y_max - y_min + 1).inflate(
+            2 * PATH_WIDTH, 2 * PATH_WIDTH
+        )
+
+        self._points_arr[:new_len] = arr[keep]
+        self._len = new_len
+        self.points = [tuple(p) for p in self._points_arr[:new_len].tolist()]
+        self._pending = []
+        self._redraw_canvas(area)
+        self._dirty = True
+
+    def _clear(self) -> None:
+        self.points.clear()
+        self._len = 0
+        self._pending = []
+        self.canvas.fill(CANVAS_BG)
+        self._dirty = True
+
+    def _export(self) -> None:
+        if not self.points:
+            print("No points to export.")
+            return
+        print(f"Exported {len(self.points)} points")
+        print(self.points[:10], "...")
+        if self.sender:
+            print("Sending path to drone...")
+            self.sender.follow_path(self.points)
+            print("Done sending path. Drone should remain facing north for this flight.")
+
+    def _handle_mouse_down(self, event: pygame.event.Event) -> None:
+        if event.button == 1:
+            self._drawing = True
+            self._add_point(event.pos)
+
+    def _handle_mouse_up(self, event: pygame.event.Event) -> None:
+        if event.button == 1:
+            self._drawing = False
+            self._end_stroke()
+
+    def _handle_mouse_motion(self, event: pygame.event.Event) -> None:
+        if not self._drawing:
+            return
+        if self.eraser_enabled:
+            self._pending_erase = event.pos
+        else:
+            self._add_point(event.pos)
+
+    def _draw_eraser_preview(self, mouse_pos: Point) -> None:
+        if not self.eraser_enabled:
+            return
+        pygame.draw.circle(self.screen, ERASE_PREVIEW, mouse_pos, self.eraser_radius, 2)
+
+    def run(self) -> None:
+        clock = pygame.time.Clock()
+        while self._running:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    self._running = False
+                elif event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_ESCAPE:
+                        self._running = False
+                    elif event.key == pygame.K_SPACE:
+                        self._export()
+                    elif event.key == pygame.K_c:
+                        self._clear()
+                    elif event.key == pygame.K_e:
+                        self.eraser_enabled = not self.eraser_enabled
+                        self._end_stroke()
+                        self._dirty = True
+                elif event.type == pygame.MOUSEBUTTONDOWN:
+                    self._handle_mouse_down(event)
+                elif event.type == pygame.MOUSEBUTTONUP:
+                    self._handle_mouse_up(event)
+                elif event.type == pygame.MOUSEMOTION:
+                    if self.eraser_enabled:
+                        # The eraser preview follows the cursor.
+                        self._dirty = True
+                    self._handle_mouse_motion(event)
+                elif event.type == pygame.WINDOWEXPOSED:
+                    self._dirty = True
+
+            if self._pending_erase is not None:
+                self._erase_at(self._pending_erase)
+                self._pending_erase = None
+
+            if self._dirty:
+                self._flush_pending()
+                self.screen.blit(self.canvas, (0, 0))
+                self._render_text()
+                self._draw_eraser_preview(pygame.mouse.get_pos())
+                pygame.display.flip()
+                self._dirty = False
+            clock.tick(60)
+
+        pygame.quit()
+
+
+if __name__ == "__main__":
+    sender = PathCommandSender()
+    try:
+        SimpleDraw(sender=sender).run()
+    finally:
+        sender.stop()
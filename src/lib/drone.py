@@ -1,4 +1,6 @@
+import select
 import socket
+import threading
 import time
 
 class Drone:
@@ -16,6 +18,12 @@ class Drone:
     TRANSMITTER = None
     RECEIVER = None
     RECEIVER_CLOSED = False
+    LOCK = None
+
+    # Any channel/command write marks the state dirty until the next frame.
+    STATE_DIRTY = True
+    LAST_SEND = None
+    HEARTBEAT_INTERVAL = 0.5
 
     MESSAGE_HEADER = None
     MESSAGE = None
@@ -42,6 +50,8 @@ class Drone:
         self.PORT = port
         self.TRANSMITTER = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         self.RECEIVER = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        # Guards the RC channels so a frame never mixes old and new values.
+        self.LOCK = threading.Lock()
 
         self.MESSAGE_HEADER = bytearray([0xef, 0x02, 0x7c, 0x00, 0x02, 0x02, 0x00, 0x01, 0x02, 0x00, 0x00, 0x00])
         self.COUNTER_1_SUFFIX = bytearray([0x00, 0x00, 0x14, 0x00, 0x66, 0x14])
@@ -73,8 +83,10 @@ class Drone:
         counter_1 = bytearray([(self.COUNTER_1_1), (self.COUNTER_1_2)])
         counter_2 = bytearray([(self.COUNTER_2_1), (self.COUNTER_2_2)])
         counter_3 = bytearray([(self.COUNTER_3_1), (self.COUNTER_3_2)])
-        control = bytearray([(self.ROLL), (self.PITCH), (self.THROTTLE), (self.YAW), (self.COMMAND), (self.HEADLESS)])
-        checksum = bytearray([(self.ROLL ^ self.PITCH ^ self.THROTTLE ^ self.YAW ^ self.COMMAND ^ self.HEADLESS)])
+        with self.LOCK:
+            control = bytearray([(self.ROLL), (self.PITCH), (self.THROTTLE), (self.YAW), (self.COMMAND), (self.HEADLESS)])
+            self.STATE_DIRTY = False
+        checksum = bytearray([(control[0] ^ control[1] ^ control[2] ^ control[3] ^ control[4] ^ control[5])])
 
         self.MESSAGE = self.MESSAGE_HEADER + counter_1 + self.COUNTER_1_SUFFIX + control + self.CONTROL_SUFFIX + checksum + self.CHECKSUM_SUFFIX + counter_2 + self.COUNTER_2_SUFFIX + counter_3 + self.COUNTER_3_SUFFIX
 
@@ -84,9 +96,22 @@ class Drone:
         self.TRANSMITTER.sendto(self.MESSAGE, (self.IP, self.PORT))
         pass
 
-    def initialize_image(self) -> None:
+    def send_if_changed(self) -> bool:
+        # Idle state is only repeated as a heartbeat instead of every tick.
+        now = time.monotonic()
+        if not self.STATE_DIRTY and self.LAST_SEND is not None and now - self.LAST_SEND < self.HEARTBEAT_INTERVAL:
+            return False
+        self.build_message()
+        self.send_message()
+        self.LAST_SEND = now
+        return True
+
+    def initialize_image(self, timeout=0.1) -> bool:
+        # The drone answers by streaming video back to the sending socket, so
+        # anything readable within the timeout means it is ready.
         self.RECEIVER.sendto(bytearray([0xef, 0x00, 0x04, 0x00]), ("192.168.169.1", 8800))
-        pass
+        readable, _, _ = select.select([self.RECEIVER], [], [], timeout)
+        return bool(readable)
 
     def image_listener(self) -> None:
         self.RECEIVER.sendto(bytearray([0xef, 0x00, 0x04, 0x00]), ("192.168.169.1", 1234))
@@ -111,32 +136,50 @@ class Drone:
 
     def takeoff(self) -> None:
         self.COMMAND = self.COMMAND_TAKEOFF
+        self.STATE_DIRTY = True
         pass
 
     def stop(self) -> None:
         self.COMMAND = self.COMMAND_STOP
+        self.STATE_DIRTY = True
         pass
 
     def land(self) -> None:
         self.COMMAND = self.COMMAND_LAND
+        self.STATE_DIRTY = True
         pass
 
     def calibrate(self) -> None:
         self.COMMAND = self.COMMAND_CALIBRATE
+        self.STATE_DIRTY = True
+        pass
+
+    def set_rc(self, pitch, roll, throttle, yaw=None) -> None:
+        with self.LOCK:
+            self.PITCH = pitch
+            self.ROLL = roll
+            self.THROTTLE = throttle
+            if yaw is not None:
+                self.YAW = yaw
+            self.STATE_DIRTY = True
         pass
 
     def set_roll(self, value) -> None:
         self.ROLL = value
+        self.STATE_DIRTY = True
         pass
 
     def set_pitch(self, value) -> None:
         self.PITCH = value
+        self.STATE_DIRTY = True
         pass
 
     def set_throttle(self, value) -> None:
         self.THROTTLE = value
+        self.STATE_DIRTY = True
         pass
 
     def set_yaw(self, value) -> None:
         self.YAW = value
+        self.STATE_DIRTY = True
         pass
\ No newline at end of file
@@ -0,0 +1,117 @@
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from lib.drone import Drone
+from lib.path_simplify import rdp
+
+
+Point = Tuple[int, int]
+SEND_INTERVAL = 0.1
+
+
+@dataclass(slots=True)
+class RCCommand:
+    pitch: int = 127
+    roll: int = 127
+    throttle: int = 127
+
+
+class PathCommandSender:
+    """
+    Convert a list of 2D points into RC commands and send them to the drone.
+
+    The drone is assumed to face "north" for the full path, so movement is
+    derived directly from the x/y deltas (no yaw commands). Positive roll moves
+    east, positive pitch moves south, and throttle stays constant unless
+    overridden.
+    """
+
+    def __init__(
+        self,
+        drone: Optional[Drone] = None,
+        send_callback: Optional[Callable[[RCCommand], None]] = None,
+        step_delay: float = 0.25,
+        speed_multiplier: int = 48,
+        pixel_scale: float = 50.0,
+        simplify_epsilon: Optional[float] = None,
+    ) -> None:
+        self.drone = drone if send_callback is None else None
+        self.send_callback = send_callback
+        self.step_delay = step_delay
+        self.speed_multiplier = speed_multiplier
+        self.pixel_scale = pixel_scale
+        # RC offset per pixel of movement
+        self._scale = float(speed_multiplier) / float(pixel_scale)
+        # Paths are simplified before sending so each step is a meaningful
+        # move rather than one mouse sample; 0 disables simplification.
+        self.simplify_epsilon = pixel_scale / 2 if simplify_epsilon is None else simplify_epsilon
+
+        self._stopped = threading.Event()
+        self._drone_thread: Optional[threading.Thread] = None
+
+        if self.drone:
+            self._start_background_sender()
+
+    def _start_background_sender(self) -> None:
+        self._stopped.clear()
+        self._drone_thread = threading.Thread(target=self._drone_loop, daemon=True)
+        self._drone_thread.start()
+
+    def _drone_loop(self) -> None:
+        assert self.drone is not None
+        next_tick = time.monotonic()
+        while not self._stopped.is_set():
+            self.drone.send_if_changed()
+            next_tick = max(next_tick + SEND_INTERVAL, time.monotonic() - SEND_INTERVAL)
+            self._stopped.wait(max(0.0, next_tick - time.monotonic()))
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._drone_thread:
+            self._drone_thread.join(timeout=1)
+
+    def _send(self, command: RCCommand) -> None:
+        if self.drone:
+            self.drone.set_rc(command.pitch, command.roll, command.throttle)
+        if self.send_callback:
+            self.send_callback(command)
+
+    def follow_path(self, points: Iterable[Point], base: Optional[RCCommand] = None) -> List[RCCommand]:
+        base_command = base or RCCommand()
+        commands: List[RCCommand] = []
+
+        point_list = list(points)
+        if len(point_list) < 2:
+            return commands
+
+        # Convert every segment in one vectorized pass; only the send/sleep
+        # loop below has to run per step.
+        pts = np.asarray(point_list, dtype=np.int32)
+        deltas = np.diff(pts, axis=0)
+        if self.simplify_epsilon > 0:
+            deltas = np.diff(rdp(pts, self.simplify_epsilon), axis=0).astype(np.float64)
+            # Simplified segments can be long; split them into steps of at most
+            # pixel_scale so a single command doesn't saturate the sticks.
+            steps = np.maximum(np.ceil(np.abs(deltas).max(axis=1) / self.pixel_scale), 1).astype(np.int64)
+            deltas = np.repeat(deltas / steps[:, None], steps, axis=0)
+        # y on the canvas grows downward, so moving north (negative dy) means
+        # increasing pitch.
+        rolls = np.clip((base_command.roll + deltas[:, 0] * self._scale).astype(np.int32), 0, 255)
+        pitches = np.clip((base_command.pitch - deltas[:, 1] * self._scale).astype(np.int32), 0, 255)
+
+        commands = [
+            RCCommand(pitch=pitch, roll=roll, throttle=base_command.throttle)
+            for pitch, roll in zip(pitches.tolist(), rolls.tolist())
+        ]
+        for command in commands:
+            self._send(command)
+            time.sleep(self.step_delay)
+
+        # Return to hover
+        self._send(base_command)
+        commands.append(base_command)
+        return commands
@@ -0,0 +1,46 @@
+import numpy as np
+
+
+def rdp(points: np.ndarray, epsilon: float) -> np.ndarray:
+    """
+    Simplify a polyline with the Ramer-Douglas-Peucker algorithm.
+
+    ``points`` is an (N, 2) array. Points closer than ``epsilon`` to the chord
+    between their kept neighbours are dropped; the first and last points are
+    always kept. Returns the kept rows of ``points`` in their original order.
+    """
+    points = np.asarray(points)
+    count = len(points)
+    if count < 3 or epsilon <= 0:
+        return points
+
+    pts = points.astype(np.float64)
+    keep = np.zeros(count, dtype=bool)
+    keep[0] = keep[-1] = True
+
+    # Iterative rather than recursive so long hand-drawn paths can't hit the
+    # recursion limit.
+    stack = [(0, count - 1)]
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+
+        chord = pts[end] - pts[start]
+        rel = pts[start + 1 : end] - pts[start]
+        length = float(np.hypot(chord[0], chord[1]))
+        if length == 0.0:
+            # Closed loop: fall back to the distance from the shared endpoint.
+            dists = np.hypot(rel[:, 0], rel[:, 1])
+        else:
+            # Perpendicular distance to the chord via the 2D cross product.
+            dists = np.abs(chord[0] * rel[:, 1] - chord[1] * rel[:, 0]) / length
+
+        farthest = int(np.argmax(dists))
+        if dists[farthest] > epsilon:
+            split = start + 1 + farthest
+            keep[split] = True
+            stack.append((start, split))
+            stack.append((split, end))
+
+    return points[keep]
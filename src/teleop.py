@@ -1,133 +1,142 @@
-import _thread
+import signal
 import threading
 import time
-from typing import Set
+
+import pygame
 
 from lib.drone import Drone
-from pynput import keyboard
 
 NEUTRAL_VALUE = 127
 SPEED_MULTIPLIER = 48
-MOVEMENT_KEYS = ["w", "s", "a", "d", "i", "m"]
+SEND_INTERVAL = 0.1
+WINDOW_SIZE = (420, 90)
+INFO_BG = (40, 40, 40)
+INFO_TEXT = (230, 230, 230)
 
 
 class TeleopSession:
-    """Keyboard-driven teleoperation for the drone."""
+    """Keyboard-driven teleoperation for the drone.
+
+    Keys are read from a small pygame window: held movement keys are polled
+    on every send tick and one-shot commands come from key-down events, so
+    input handling and frame sending share a single thread.
+    """
+
+    # (pitch, roll, throttle) for each of the 27 possible movement vectors
+    _CMD_CACHE = {
+        (x, y, z): (
+            NEUTRAL_VALUE + x * SPEED_MULTIPLIER,
+            NEUTRAL_VALUE + y * SPEED_MULTIPLIER,
+            NEUTRAL_VALUE + z * SPEED_MULTIPLIER,
+        )
+        for x in (-1, 0, 1)
+        for y in (-1, 0, 1)
+        for z in (-1, 0, 1)
+    }
+
+    # One-shot commands keyed by pygame key code
+    _ACTION = {
+        pygame.K_q: lambda d: d.set_yaw(63),
+        pygame.K_e: lambda d: d.set_yaw(191),
+        pygame.K_r: lambda d: d.calibrate(),
+        pygame.K_f: lambda d: d.takeoff(),
+        pygame.K_v: lambda d: d.land(),
+        pygame.K_c: lambda d: d.stop(),
+        pygame.K_j: lambda d: d.reset_command(),
+    }
 
     def __init__(self) -> None:
         self.drone = Drone()
-        self._running = threading.Event()
-        self._running.set()
+        self._stopped = threading.Event()
 
-        self._movement_pressed: Set[str] = set()
-        self._movement_vector = [0, 0, 0]  # x, y, z
+        self._movement_vector = (0, 0, 0)  # x, y, z
 
         self._initialize_drone()
-        self._drone_thread = threading.Thread(target=self._background, daemon=True)
-        self._drone_thread.start()
+        self._open_window()
 
     def _initialize_drone(self) -> None:
-        init_end = time.time() + 1
-        while time.time() < init_end:
-            self.drone.initialize_image()
-            time.sleep(0.1)
-
-    def _background(self) -> None:
-        while self._running.is_set():
-            self.drone.build_message()
-            self.drone.send_message()
-            time.sleep(0.1)
-
-    def _update_movement_vector(self) -> None:
-        self._movement_vector = [0, 0, 0]
-        if "w" in self._movement_pressed:
-            self._movement_vector[0] += 1
-        if "s" in self._movement_pressed:
-            self._movement_vector[0] -= 1
-        if "a" in self._movement_pressed:
-            self._movement_vector[1] -= 1
-        if "d" in self._movement_pressed:
-            self._movement_vector[1] += 1
-        if "i" in self._movement_pressed:
-            self._movement_vector[2] += 1
-        if "m" in self._movement_pressed:
-            self._movement_vector[2] -= 1
+        # Each attempt waits up to 0.1s for the drone to start streaming.
+        for _ in range(10):
+            if self.drone.initialize_image():
+                break
+
+    def _open_window(self) -> None:
+        pygame.init()
+        self.screen = pygame.display.set_mode(WINDOW_SIZE)
+        pygame.display.set_caption("Drone teleop")
+
+        font = pygame.font.Font(None, 22)
+        info_lines = [
+            "W/S: pitch | A/D: roll | I/M: throttle | Q/E: yaw",
+            "F: takeoff | V: land | C: stop | R: calibrate | J: reset",
+            "Keep this window focused. Esc/Close: quit",
+        ]
+        self.screen.fill(INFO_BG)
+        y = 10
+        for line in info_lines:
+            self.screen.blit(font.render(line, True, INFO_TEXT), (10, y))
+            y += 24
+        pygame.display.flip()
 
     def _apply_movement(self) -> None:
-        pitch = NEUTRAL_VALUE + self._movement_vector[0] * SPEED_MULTIPLIER
-        roll = NEUTRAL_VALUE + self._movement_vector[1] * SPEED_MULTIPLIER
-        throttle = NEUTRAL_VALUE + self._movement_vector[2] * SPEED_MULTIPLIER
-
-        self.drone.set_pitch(pitch)
-        self.drone.set_roll(roll)
-        self.drone.set_throttle(throttle)
-
-    def on_press(self, key: keyboard.Key | keyboard.KeyCode) -> bool | None:
-        key_char = getattr(key, "char", None)
-
-        if key_char == "\x03":  # Ctrl+C
-            self._running.clear()
-            _thread.interrupt_main()
-            return False
-
-        if key_char is None:
-            # Special keys (e.g., arrows) are ignored
-            return
-
-        if key_char in MOVEMENT_KEYS:
-            self._movement_pressed.add(key_char)
-            self._update_movement_vector()
+        pitch, roll, throttle = self._CMD_CACHE[self._movement_vector]
+        self.drone.set_rc(pitch, roll, throttle)
+
+    def _poll_movement(self) -> None:
+        keys = pygame.key.get_pressed()
+        vector = (
+            keys[pygame.K_w] - keys[pygame.K_s],
+            keys[pygame.K_d] - keys[pygame.K_a],
+            keys[pygame.K_i] - keys[pygame.K_m],
+        )
+        # Only touch the drone on change so an idle stick stays a heartbeat.
+        if vector != self._movement_vector:
+            self._movement_vector = vector
             self._apply_movement()
 
-        if key_char == "q":
-            self.drone.set_yaw(63)
-        elif key_char == "e":
-            self.drone.set_yaw(191)
-        elif key_char == "r":
-            self.drone.calibrate()
-        elif key_char == "f":
-            self.drone.takeoff()
-        elif key_char == "v":
-            self.drone.land()
-        elif key_char == "c":
-            self.drone.stop()
-        elif key_char == "j":
-            self.drone.reset_command()
-
-    def on_release(self, key: keyboard.Key | keyboard.KeyCode) -> bool | None:
-        if key == keyboard.Key.esc:
-            self._running.clear()
-            return False
-
-        key_char = getattr(key, "char", None)
-        if key_char is None:
-            return None
-
-        if key_char in MOVEMENT_KEYS and key_char in self._movement_pressed:
-            self._movement_pressed.remove(key_char)
-            self._update_movement_vector()
-            self._apply_movement()
+    def _handle_key(self, event: pygame.event.Event) -> None:
+        if event.key == pygame.K_ESCAPE or (event.key == pygame.K_c and event.mod & pygame.KMOD_CTRL):
+            self._stopped.set()
+            return
 
-        return None
+        action = self._ACTION.get(event.key)
+        if action:
+            action(self.drone)
+
+    def run(self) -> None:
+        # Deadlines are absolute so send cost doesn't accumulate as drift; after
+        # a stall of more than a tick we resync instead of bursting to catch up.
+        next_tick = time.monotonic()
+        while not self._stopped.is_set():
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    self._stopped.set()
+                elif event.type == pygame.KEYDOWN:
+                    self._handle_key(event)
+
+            self._poll_movement()
+            self.drone.send_if_changed()
+            next_tick = max(next_tick + SEND_INTERVAL, time.monotonic() - SEND_INTERVAL)
+            self._stopped.wait(max(0.0, next_tick - time.monotonic()))
 
     def stop(self) -> None:
-        self._running.clear()
-        if self._drone_thread.is_alive():
-            self._drone_thread.join()
+        self._stopped.set()
         self.drone.stop()
+        pygame.quit()
+
+
+def _interrupt(teleop: TeleopSession) -> None:
+    print("Interrupted!")
+    teleop._stopped.set()
 
 
 if __name__ == "__main__":
     teleop = TeleopSession()
+    # Ctrl+C in the terminal ends the send loop like Esc does instead of
+    # raising KeyboardInterrupt at an arbitrary point mid-send.
+    signal.signal(signal.SIGINT, lambda signum, frame: _interrupt(teleop))
     try:
-        while teleop._running.is_set():
-            with keyboard.Listener(
-                on_press=teleop.on_press, # type: ignore
-                on_release=teleop.on_release, # type: ignore
-            ) as listener:
-                print("Ready To Teleop")
-                listener.join()
-    except KeyboardInterrupt:
-        print("Interrupted!")
+        print("Ready To Teleop")
+        teleop.run()
     finally:
         teleop.stop()
@@ -6,42 +6,50 @@ from lib.drone import Drone
 
 NEUTRAL_VALUE = 127
 MAX_SPEED = 123
+SEND_INTERVAL = 0.1
 Direction = Literal["forward", "back", "left", "right", "up", "down"]
 
 
 class DroneTeleopAPI:
     """Simple API for commanding the drone without keyboard input."""
 
+    # direction -> (pitch, roll, throttle) sign of the speed offset
+    _DIR_DELTA = {
+        "forward": (1, 0, 0),
+        "back": (-1, 0, 0),
+        "right": (0, 1, 0),
+        "left": (0, -1, 0),
+        "up": (0, 0, 1),
+        "down": (0, 0, -1),
+    }
+
     def __init__(self):
         self.drone = Drone()
-        self._running = threading.Event()
-        self._running.set()
+        self._stopped = threading.Event()
         self._initialize_drone()
         self._drone_thread = threading.Thread(target=self._background, daemon=True)
         self._drone_thread.start()
 
     def _initialize_drone(self) -> None:
-        init_end = time.time() + 1
-        while time.time() < init_end:
-            self.drone.initialize_image()
-            time.sleep(0.1)
+        # Each attempt waits up to 0.1s for the drone to start streaming.
+        for _ in range(10):
+            if self.drone.initialize_image():
+                break
 
     def _background(self) -> None:
-        while self._running.is_set():
-            self.drone.build_message()
-            self.drone.send_message()
-            time.sleep(0.1)
-
-    def _clamp_speed(self, speed: int) -> int:
-        return max(0, min(MAX_SPEED, speed))
+        next_tick = time.monotonic()
+        while not self._stopped.is_set():
+            self.drone.send_if_changed()
+            next_tick = max(next_tick + SEND_INTERVAL, time.monotonic() - SEND_INTERVAL)
+            self._stopped.wait(max(0.0, next_tick - time.monotonic()))
 
-    def _clamp_output(self, value: int) -> int:
-        return max(0, min(255, value))
+    @staticmethod
+    def _clamp_speed(speed: int) -> int:
+        # Chained comparisons instead of max()/min() builtin calls.
+        return speed if 0 <= speed <= MAX_SPEED else (0 if speed < 0 else MAX_SPEED)
 
     def _reset_movement(self) -> None:
-        self.drone.set_pitch(NEUTRAL_VALUE)
-        self.drone.set_roll(NEUTRAL_VALUE)
-        self.drone.set_throttle(NEUTRAL_VALUE)
+        self.drone.set_rc(NEUTRAL_VALUE, NEUTRAL_VALUE, NEUTRAL_VALUE)
 
     def move(self, direction: Direction, duration: float, speed: int) -> None:
         """Command a directional move for a specific duration.
@@ -52,29 +60,19 @@ class DroneTeleopAPI:
             speed: Relative speed from 0 to 123 (mapped to byte offsets).
         """
 
+        try:
+            dp, dr, dt = self._DIR_DELTA[direction]
+        except KeyError:
+            raise ValueError(f"Unknown direction: {direction}") from None
+
+        # NEUTRAL_VALUE +/- MAX_SPEED stays within 4..250, so no output clamp
+        # is needed once the speed itself is clamped.
         scaled_speed = self._clamp_speed(speed)
-        pitch = NEUTRAL_VALUE
-        roll = NEUTRAL_VALUE
-        throttle = NEUTRAL_VALUE
-
-        if direction == "forward":
-            pitch += scaled_speed
-        elif direction == "back":
-            pitch -= scaled_speed
-        elif direction == "right":
-            roll += scaled_speed
-        elif direction == "left":
-            roll -= scaled_speed
-        elif direction == "up":
-            throttle += scaled_speed
-        elif direction == "down":
-            throttle -= scaled_speed
-        else:
-            raise ValueError(f"Unknown direction: {direction}")
-
-        self.drone.set_pitch(self._clamp_output(pitch))
-        self.drone.set_roll(self._clamp_output(roll))
-        self.drone.set_throttle(self._clamp_output(throttle))
+        self.drone.set_rc(
+            NEUTRAL_VALUE + dp * scaled_speed,
+            NEUTRAL_VALUE + dr * scaled_speed,
+            NEUTRAL_VALUE + dt * scaled_speed,
+        )
 
         time.sleep(max(0.0, duration))
         self._reset_movement()
@@ -82,7 +80,7 @@ class DroneTeleopAPI:
     def shutdown(self) -> None:
         """Stop background messaging and reset the drone."""
 
-        self._running.clear()
+        self._stopped.set()
         if self._drone_thread.is_alive():
             self._drone_thread.join()
         self._reset_movement()
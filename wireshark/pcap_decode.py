@@ -17,11 +17,21 @@ These offsets match the description you posted, but you can adjust them if your
 from __future__ import annotations
 
 import argparse
-from dataclasses import dataclass
-from typing import Dict, Iterable, List, Optional, Tuple
+from array import array
+import mmap
+import multiprocessing
+import shutil
+import struct
+import subprocess
+import sys
+from typing import BinaryIO, Dict, Iterable, List, Optional, Tuple
 
-from scapy.all import PcapReader  # type: ignore
-from scapy.layers.inet import IP, UDP  # type: ignore
+import numpy as np
+
+try:
+    from numba import njit  # type: ignore
+except ImportError:  # optional: fall back to the NumPy classifier
+    njit = None
 
 
 NEUTRAL = 0x80
@@ -32,6 +42,16 @@ DEFAULT_DEADBAND = 12  # tweak if your sticks are noisy
 # Minimum time between counting the same event again (seconds)
 DEFAULT_DEBOUNCE = 0.60
 
+# Timestamps are carried as integer microseconds since the epoch
+US_PER_S = 1_000_000
+
+# RC frames classified per vectorized batch; bounds memory on long captures
+BATCH_FRAMES = 1 << 16
+
+# Capture file read buffer; control frames are tiny, so per-record reads are
+# dominated by syscalls unless the buffer is large
+DEFAULT_READ_BUFFER = 1 << 20
+
 # Some common command byte mappings (adjust if your drone differs)
 COMMANDS = {
     0x00: "none",
@@ -42,184 +62,1006 @@ COMMANDS = {
 }
 
 
-@dataclass
-class RCFrame:
-    ts: float
-    roll: int
-    pitch: int
-    throttle: int
-    yaw: int
-    cmd: int
-    headless: int
-    raw: bytes
+RC_FRAME_LEN = 20
 
+# Named view over one raw RC frame; the bytes are never copied into it.
+RC_FRAME_DTYPE = np.dtype(
+    {
+        "names": ["start", "roll", "pitch", "throttle", "yaw", "cmd", "headless", "checksum", "end"],
+        "formats": ["u1"] * 9,
+        "offsets": [0, 2, 3, 4, 5, 6, 7, 18, 19],
+        "itemsize": RC_FRAME_LEN,
+    }
+)
 
-def is_candidate_rc_frame(payload: bytes) -> bool:
-    return (
-        len(payload) == 20
-        and payload[0] == 0x66
-        and payload[-1] == 0x99
-    )
+# Event codes: every label the classifier can emit is a small int indexing
+# EVENT_LABELS. The eight axis directions come first; command and headless
+# labels follow, looked up per byte through CMD_EVENT / HEADLESS_EVENT.
+EVT_FORWARD, EVT_BACK, EVT_RIGHT, EVT_LEFT, EVT_UP, EVT_DOWN, EVT_YAW_RIGHT, EVT_YAW_LEFT = range(8)
+NO_EVENT = -1
+
+# (column in frames[:, 2:6], positive code, negative code); naming may need
+# flipping depending on your drone.
+# NOTE: many drones map pitch+ as forward, roll+ as right; some are inverted.
+AXES = (
+    (1, EVT_FORWARD, EVT_BACK),
+    (0, EVT_RIGHT, EVT_LEFT),
+    (2, EVT_UP, EVT_DOWN),
+    (3, EVT_YAW_RIGHT, EVT_YAW_LEFT),
+)
+AXIS_COLS = np.array([col for col, _, _ in AXES], dtype=np.int64)
+AXIS_POS = np.array([pos for _, pos, _ in AXES], dtype=np.int64)
+AXIS_NEG = np.array([neg for _, _, neg in AXES], dtype=np.int64)
+
+
+def command_label(cmd: int) -> str:
+    name = COMMANDS.get(cmd)
+    return name if name is not None and name != "none" else f"cmd_0x{cmd:02x}"
+
+
+def headless_label(headless: int) -> str:
+    # common: 0x02 off, 0x03 on
+    if headless == 0x03:
+        return "headless_on"
+    if headless == 0x02:
+        return "headless_off"
+    return f"headless_0x{headless:02x}"
+
+
+def _byte_event_table(labels: List[str], label_of) -> np.ndarray:
+    # 256-entry byte -> event code table, appending new labels as they appear so
+    # bytes that share a label also share a code. A zero byte never emits.
+    # Formatted labels are interned like the literal ones, so the summary's
+    # label-keyed lookups compare by identity.
+    codes = {label: code for code, label in enumerate(labels)}
+    table = np.full(256, NO_EVENT, dtype=np.int32)
+    for b in range(1, 256):
+        table[b] = codes.setdefault(sys.intern(label_of(b)), len(codes))
+    labels.extend(sorted(codes.keys() - set(labels), key=codes.get))
+    return table
+
+
+EVENT_LABELS = ["forward", "back", "right", "left", "up", "down", "yaw_right", "yaw_left"]
+CMD_EVENT = _byte_event_table(EVENT_LABELS, command_label)
+HEADLESS_EVENT = _byte_event_table(EVENT_LABELS, headless_label)
+N_EVENT_CODES = len(EVENT_LABELS)
+
+
+def _infer_event_codes_numpy(frames: np.ndarray, deadband: int) -> Tuple[np.ndarray, np.ndarray]:
+    rows: List[np.ndarray] = []
+    codes: List[np.ndarray] = []
+
+    def emit(mask: np.ndarray, code) -> None:
+        idx = np.flatnonzero(mask)
+        rows.append(idx)
+        codes.append(code[idx] if isinstance(code, np.ndarray) else np.full(len(idx), code))
+
+    # Special command byte
+    cmd = CMD_EVENT[frames[:, 6]]
+    emit(cmd != NO_EVENT, cmd)
+
+    # Axis movements
+    delta = frames[:, 2:6].astype(np.int16) - NEUTRAL
+    for col, pos_code, neg_code in AXES:
+        emit(delta[:, col] > deadband, pos_code)
+        emit(delta[:, col] < -deadband, neg_code)
+
+    # Headless mode byte (optional)
+    headless = HEADLESS_EVENT[frames[:, 7]]
+    emit(headless != NO_EVENT, headless)
+
+    return np.concatenate(rows), np.concatenate(codes).astype(np.int32)
+
+
+if njit is not None:
+
+    @njit(cache=True)
+    def _classify_kernel(frames, deadband, out_rows, out_codes):
+        # Branchless compaction: every candidate event is written at slot k and
+        # k only advances when the condition holds, so the data-dependent stick
+        # values never steer a branch. Writes stay below 6 * n since k grows by
+        # at most six per frame.
+        k = 0
+        for i in range(frames.shape[0]):
+            cmd = CMD_EVENT[frames[i, 6]]
+            out_rows[k] = i
+            out_codes[k] = cmd
+            k += cmd != NO_EVENT
+            for j in range(4):
+                d = np.int64(frames[i, 2 + AXIS_COLS[j]]) - NEUTRAL
+                out_rows[k] = i
+                out_codes[k] = AXIS_POS[j]
+                k += d > deadband
+                out_rows[k] = i
+                out_codes[k] = AXIS_NEG[j]
+                k += d < -deadband
+            headless = HEADLESS_EVENT[frames[i, 7]]
+            out_rows[k] = i
+            out_codes[k] = headless
+            k += headless != NO_EVENT
+        return k
+
+
+def infer_event_codes(frames: np.ndarray, deadband: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Turn RC frames into "instantaneous" events; we later debounce these into
+    counted events.
+
+    `frames` is an (N, 20) uint8 array of raw RC frames (one row per packet).
+    Returns (row index, event code) arrays; EVENT_LABELS maps codes back to
+    names. With Numba installed this runs a compiled per-frame loop, otherwise
+    one vectorized NumPy pass per column. Events are in capture order within
+    each code, which is all the per-label debouncer needs.
+    """
+    if njit is None:
+        return _infer_event_codes_numpy(frames, deadband)
+
+    # At most one command, four axis and one headless event per frame.
+    out_rows = np.empty(6 * len(frames), dtype=np.int64)
+    out_codes = np.empty(6 * len(frames), dtype=np.int32)
+    k = _classify_kernel(frames, deadband, out_rows, out_codes)
+    return out_rows[:k], out_codes[:k]
+
+
+# last_seen for a code that hasn't fired yet; far enough back that any capture
+# timestamp clears the debounce, close enough to zero that the int64 subtraction
+# can't overflow.
+NEVER_SEEN_US = -(1 << 62)
+
+
+def _debounce_scan(ts, codes, debounce_us, counts, last_seen) -> None:
+    for i in range(len(ts)):
+        code = codes[i]
+        if ts[i] - last_seen[code] >= debounce_us:
+            counts[code] += 1
+            last_seen[code] = ts[i]
+        # else: within debounce window -> ignore
+
+
+_debounce_kernel = njit(cache=True)(_debounce_scan) if njit is not None else None
+
+
+class EventCounter:
+    """
+    Count events, preventing rapid repeats. If an event code repeats within debounce_s,
+    it is considered the same continuous action and not counted again.
+
+    Events are fed in batches of parallel (timestamp in µs, code) arrays as the
+    capture is read; per-code state lives in flat arrays indexed by code and
+    carries over between batches. Every possible command and headless byte
+    already has its own code, so unrecognised values need no side-table.
+    """
+
+    def __init__(self, debounce_s: float, n_codes: int = N_EVENT_CODES) -> None:
+        self.debounce_s = debounce_s
+        # Integer compare on the hot path; also sidesteps float rounding at
+        # the exact debounce boundary.
+        self.debounce_us = round(debounce_s * US_PER_S)
+        self.counts = np.zeros(n_codes, dtype=np.int64)
+        self.last_seen = np.full(n_codes, NEVER_SEEN_US, dtype=np.int64)
 
+    def add(self, ts: np.ndarray, codes: np.ndarray) -> None:
+        if _debounce_kernel is not None:
+            _debounce_kernel(ts, codes, self.debounce_us, self.counts, self.last_seen)
+            return
 
-def parse_rc_frame(ts: float, payload: bytes) -> Optional[RCFrame]:
-    if not is_candidate_rc_frame(payload):
+        # Plain lists index faster than NumPy scalars in an interpreted loop.
+        counts = self.counts.tolist()
+        last_seen = self.last_seen.tolist()
+        _debounce_scan(ts.tolist(), codes.tolist(), self.debounce_us, counts, last_seen)
+        self.counts[:] = counts
+        self.last_seen[:] = last_seen
+
+    def by_label(self) -> Dict[str, int]:
+        return {EVENT_LABELS[code]: int(self.counts[code]) for code in np.flatnonzero(self.counts)}
+
+
+# Link-layer types we know how to strip down to an IPv4 header
+LINKTYPE_NULL = 0
+LINKTYPE_ETHERNET = 1
+LINKTYPE_RAW = 101
+LINKTYPE_IEEE802_11 = 105
+LINKTYPE_LINUX_SLL = 113
+LINKTYPE_IEEE802_11_RADIOTAP = 127
+LINKTYPE_IPV4 = 228
+# Linktypes whose IPv4 offset is simple enough to find with array operations
+# (the vectorized reader and process_pcap); 802.11 goes through ipv4_offset.
+ARRAY_LINKTYPES = (LINKTYPE_NULL, LINKTYPE_ETHERNET, LINKTYPE_RAW, LINKTYPE_LINUX_SLL, LINKTYPE_IPV4)
+
+ETHERTYPE_IPV4 = 0x0800
+ETHERTYPE_VLAN = (0x8100, 0x88A8)
+IPPROTO_UDP = 17
+LLC_SNAP_IPV4 = b"\xaa\xaa\x03\x00\x00\x00\x08\x00"
+
+# Fixed-layout header fields read in one unpack each:
+# IPv4 version/IHL, flags + fragment offset, protocol; UDP sport, dport, length
+IPV4_FIELDS = struct.Struct(">B5xHxB")
+UDP_HEADER = struct.Struct(">HHH")
+
+# Classic pcap magic (as read little-endian) -> (byte order, timestamp ticks per second)
+PCAP_MAGIC = {
+    0xA1B2C3D4: ("<", 1_000_000),
+    0xD4C3B2A1: (">", 1_000_000),
+    0xA1B23C4D: ("<", 1_000_000_000),
+    0x4D3CB2A1: (">", 1_000_000_000),
+}
+PCAPNG_SHB = 0x0A0D0D0A
+PCAPNG_BYTE_ORDER_MAGIC = 0x1A2B3C4D
+PCAPNG_IDB = 0x00000001
+PCAPNG_OPB = 0x00000002
+PCAPNG_SPB = 0x00000003
+PCAPNG_EPB = 0x00000006
+PCAPNG_OPT_IF_TSRESOL = 9
+
+
+def _iter_pcap(fh: BinaryIO, endian: str, ts_rate: int) -> Iterable[Tuple[int, int, bytes]]:
+    header = fh.read(20)
+    if len(header) < 20:
+        return
+    linktype = struct.unpack(endian + "I", header[16:20])[0] & 0x0FFFFFFF
+    record = struct.Struct(endian + "IIII")
+
+    while True:
+        rec_hdr = fh.read(16)
+        if len(rec_hdr) < 16:
+            return
+        sec, frac, caplen, _ = record.unpack(rec_hdr)
+        data = fh.read(caplen)
+        if len(data) < caplen:
+            return
+        yield sec * US_PER_S + frac * US_PER_S // ts_rate, linktype, data
+
+
+def _pcap_header(buf: mmap.mmap) -> Optional[Tuple[str, int, int]]:
+    # (byte order, timestamp ticks per second, linktype) of a mapped classic pcap
+    if len(buf) < 24:
         return None
+    magic = struct.unpack_from("<I", buf)[0]
+    if magic not in PCAP_MAGIC:
+        return None
+    endian, ts_rate = PCAP_MAGIC[magic]
+    return endian, ts_rate, struct.unpack_from(endian + "I", buf, 20)[0] & 0x0FFFFFFF
 
-    # Offsets based on your description: 3rd..6th bytes are RC values -> indices 2..5
-    roll = payload[2]
-    pitch = payload[3]
-    throttle = payload[4]
-    yaw = payload[5]
-    cmd = payload[6]
-    headless = payload[7]
-
-    return RCFrame(
-        ts=ts,
-        roll=roll,
-        pitch=pitch,
-        throttle=throttle,
-        yaw=yaw,
-        cmd=cmd,
-        headless=headless,
-        raw=payload,
-    )
 
+def _iter_pcap_mapped(
+    buf: mmap.mmap, endian: str, ts_rate: int, linktype: int, offset: int = 24, count: int = -1
+) -> Iterable[Tuple[int, int, memoryview]]:
+    # Walks `count` records (-1 = all) in place from `offset`; frames are views
+    # into the mapping, so nothing is read or copied until a byte is touched.
+    record = struct.Struct(endian + "IIII")
+    view = memoryview(buf)
+    end = len(buf)
+
+    while count and offset + 16 <= end:
+        count -= 1
+        sec, frac, caplen, _ = record.unpack_from(buf, offset)
+        offset += 16
+        if offset + caplen > end:
+            return
+        yield sec * US_PER_S + frac * US_PER_S // ts_rate, linktype, view[offset : offset + caplen]
+        offset += caplen
+
+
+def _map_file(path: str) -> Optional[mmap.mmap]:
+    # Not closed explicitly: frame views handed out from it may outlive the
+    # reader, and the mapping is released once the last of them is dropped.
+    with open(path, "rb") as fh:
+        try:
+            return mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):  # empty file, pipe, ...
+            return None
+
+
+def _iter_pcapng(fh: BinaryIO) -> Iterable[Tuple[int, int, bytes]]:
+    endian = "<"
+    # (linktype, timestamp ticks per second) per interface of the current section
+    interfaces: List[Tuple[int, int]] = []
+
+    while True:
+        head = fh.read(8)
+        if len(head) < 8:
+            return
+
+        if struct.unpack("<I", head[:4])[0] == PCAPNG_SHB:
+            # Each section header fixes the byte order of the blocks after it.
+            bom = fh.read(4)
+            if len(bom) < 4:
+                return
+            endian = "<" if struct.unpack("<I", bom)[0] == PCAPNG_BYTE_ORDER_MAGIC else ">"
+            total_len = struct.unpack(endian + "I", head[4:8])[0]
+            fh.read(total_len - 12)
+            interfaces = []
+            continue
+
+        block_type, total_len = struct.unpack(endian + "II", head)
+        body = fh.read(total_len - 8)
+        if total_len < 12 or len(body) < total_len - 8:
+            return
+        body = body[:-4]  # trailing copy of the block length
 
-def classify_axis(value: int, neutral: int, deadband: int, pos_label: str, neg_label: str) -> Optional[str]:
-    delta = value - neutral
-    if abs(delta) <= deadband:
+        if block_type == PCAPNG_IDB:
+            linktype = struct.unpack(endian + "H", body[:2])[0]
+            interfaces.append((linktype, _pcapng_ts_rate(body[8:], endian)))
+        elif block_type == PCAPNG_EPB:
+            if_id, ts_high, ts_low, caplen, _ = struct.unpack(endian + "IIIII", body[:20])
+            if if_id < len(interfaces):
+                linktype, ts_rate = interfaces[if_id]
+                yield ((ts_high << 32) | ts_low) * US_PER_S // ts_rate, linktype, body[20 : 20 + caplen]
+        elif block_type == PCAPNG_OPB:
+            if_id, _, ts_high, ts_low, caplen, _ = struct.unpack(endian + "HHIIII", body[:20])
+            if if_id < len(interfaces):
+                linktype, ts_rate = interfaces[if_id]
+                yield ((ts_high << 32) | ts_low) * US_PER_S // ts_rate, linktype, body[20 : 20 + caplen]
+        elif block_type == PCAPNG_SPB and interfaces:
+            # Simple packet blocks carry no timestamp and belong to interface 0.
+            linktype, _ = interfaces[0]
+            yield 0, linktype, body[4:]
+
+
+def _pcapng_ts_rate(options: bytes, endian: str) -> int:
+    offset = 0
+    while offset + 4 <= len(options):
+        code, length = struct.unpack_from(endian + "HH", options, offset)
+        if code == 0:
+            break
+        if code == PCAPNG_OPT_IF_TSRESOL and length >= 1:
+            resol = options[offset + 4]
+            return 2 ** (resol & 0x7F) if resol & 0x80 else 10**resol
+        offset += 4 + ((length + 3) & ~3)
+    return 1_000_000
+
+
+def iter_capture_frames(fh: BinaryIO) -> Iterable[Tuple[int, int, bytes]]:
+    """
+    Yield (timestamp in µs, linktype, frame bytes) for every packet in a classic pcap
+    or pcapng stream, decided by the leading magic number.
+    """
+    magic_bytes = fh.read(4)
+    if len(magic_bytes) < 4:
+        return
+    magic = struct.unpack("<I", magic_bytes)[0]
+
+    if magic == PCAPNG_SHB:
+        yield from _iter_pcapng(_Prefixed(magic_bytes, fh))
+    elif magic in PCAP_MAGIC:
+        endian, ts_rate = PCAP_MAGIC[magic]
+        yield from _iter_pcap(fh, endian, ts_rate)
+    else:
+        raise ValueError(f"Not a pcap/pcapng capture (magic 0x{magic:08x})")
+
+
+class _Prefixed:
+    """Re-prepend bytes already consumed from a stream (used for the pcapng magic)."""
+
+    def __init__(self, prefix: bytes, fh: BinaryIO) -> None:
+        self._prefix = prefix
+        self._fh = fh
+
+    def read(self, size: int) -> bytes:
+        if self._prefix:
+            head, self._prefix = self._prefix[:size], self._prefix[size:]
+            return head + self._fh.read(size - len(head))
+        return self._fh.read(size)
+
+
+def ipv4_offset(linktype: int, frame: bytes) -> Optional[int]:
+    """
+    Return the offset of the IPv4 header inside a link-layer frame, or None if
+    the frame doesn't carry IPv4 (or uses a link type we don't decode).
+    """
+    if linktype in (LINKTYPE_RAW, LINKTYPE_IPV4):
+        return 0
+    if linktype == LINKTYPE_ETHERNET:
+        offset = 12
+        while offset + 2 <= len(frame):
+            ethertype = (frame[offset] << 8) | frame[offset + 1]
+            if ethertype in ETHERTYPE_VLAN:
+                offset += 4
+                continue
+            return offset + 2 if ethertype == ETHERTYPE_IPV4 else None
+        return None
+    if linktype == LINKTYPE_LINUX_SLL:
+        if len(frame) >= 16 and (frame[14] << 8) | frame[15] == ETHERTYPE_IPV4:
+            return 16
+        return None
+    if linktype == LINKTYPE_NULL:
+        # 4-byte address family in host byte order; AF_INET is 2 everywhere.
+        if len(frame) >= 4 and 2 in (frame[0], frame[3]):
+            return 4
+        return None
+    if linktype == LINKTYPE_IEEE802_11_RADIOTAP:
+        if len(frame) < 4:
+            return None
+        rt_len = frame[2] | (frame[3] << 8)
+        inner = _dot11_ipv4_offset(frame[rt_len:])
+        return None if inner is None else rt_len + inner
+    if linktype == LINKTYPE_IEEE802_11:
+        return _dot11_ipv4_offset(frame)
+    return None
+
+
+def _dot11_ipv4_offset(frame: bytes) -> Optional[int]:
+    # Only unencrypted data frames carry a readable LLC/SNAP + IPv4 payload,
+    # which is what a monitor-mode capture of an open drone AP contains.
+    if len(frame) < 24:
+        return None
+    fc0, fc1 = frame[0], frame[1]
+    if (fc0 >> 2) & 0x3 != 2 or fc1 & 0x40:
+        return None
+    offset = 30 if fc1 & 0x03 == 0x03 else 24
+    if fc0 & 0x80:  # QoS data subtypes
+        offset += 2
+        if fc1 & 0x80:  # +HTC
+            offset += 4
+    if frame[offset : offset + 8] != LLC_SNAP_IPV4:
         return None
-    return pos_label if delta > 0 else neg_label
+    return offset + 8
 
 
-def infer_event(frame: RCFrame, deadband: int) -> List[str]:
+def udp_from_ipv4(frame: memoryview, offset: int) -> Optional[Tuple[int, int, memoryview]]:
     """
-    Turn a single RC frame into zero or more "instantaneous" labels.
-    We later debounce these into counted events.
+    Decode (sport, dport, payload) from an IPv4 header at `offset`, or None if
+    it isn't the first fragment of a UDP datagram.
     """
-    events: List[str] = []
+    if len(frame) < offset + 20:
+        return None
+    ver_ihl, frag, proto = IPV4_FIELDS.unpack_from(frame, offset)
+    if ver_ihl >> 4 != 4 or proto != IPPROTO_UDP:
+        return None
+    if frag & 0x1FFF:
+        return None  # non-first fragment, no UDP header here
+    udp = offset + (ver_ihl & 0x0F) * 4
+    if len(frame) < udp + 8:
+        return None
+    sport, dport, length = UDP_HEADER.unpack_from(frame, udp)
+    # Bound by the UDP length so Ethernet padding / 802.11 FCS isn't included.
+    return sport, dport, frame[udp + 8 : udp + max(length, 8)]
 
-    # Special command byte
-    if frame.cmd in COMMANDS and COMMANDS[frame.cmd] != "none":
-        events.append(COMMANDS[frame.cmd])
-    elif frame.cmd != 0x00:
-        events.append(f"cmd_0x{frame.cmd:02x}")
-
-    # Axis movements (naming may need flipping depending on your drone)
-    # NOTE: many drones map pitch+ as forward, roll+ as right; some are inverted.
-    pitch_evt = classify_axis(frame.pitch, NEUTRAL, deadband, "forward", "back")
-    roll_evt = classify_axis(frame.roll, NEUTRAL, deadband, "right", "left")
-    thr_evt = classify_axis(frame.throttle, NEUTRAL, deadband, "up", "down")
-    yaw_evt = classify_axis(frame.yaw, NEUTRAL, deadband, "yaw_right", "yaw_left")
-
-    for e in (pitch_evt, roll_evt, thr_evt, yaw_evt):
-        if e:
-            events.append(e)
 
-    # Headless mode byte (optional)
-    if frame.headless not in (0x00, 0x02, 0x03):  # common: 0x02 off, 0x03 on
-        events.append(f"headless_0x{frame.headless:02x}")
-    elif frame.headless == 0x03:
-        events.append("headless_on")
-    elif frame.headless == 0x02:
-        events.append("headless_off")
+def extract_rc_frames(
+    pcap_path: str, dport: int, read_buffer: int = DEFAULT_READ_BUFFER
+) -> Iterable[Tuple[int, memoryview]]:
+    """
+    Yield (timestamp in µs, RC frame) from a pcap or pcapng capture for UDP packets to or
+    from `dport` whose payload looks like a control frame (20 bytes, 0x66 ... 0x99).
+    Frames are decoded with plain struct offsets (Ethernet, Linux cooked, raw IP,
+    and 802.11/radiotap data frames) instead of dissecting every packet with a
+    full protocol stack, and payloads are zero-copy memoryview slices. Classic
+    pcap files are memory-mapped and walked in place; pcapng and anything that
+    can't be mapped is read through a `read_buffer`-sized buffer.
+    """
+    buf = _map_file(pcap_path)
+    header = _pcap_header(buf) if buf is not None else None
+    if header is not None:
+        yield from _rc_frames(_iter_pcap_mapped(buf, *header), dport)
+        return
 
-    return events
+    with open(pcap_path, "rb", buffering=read_buffer) as fh:
+        yield from _rc_frames(iter_capture_frames(fh), dport)
 
 
-def debounce_and_count(events_over_time: List[Tuple[float, str]], debounce_s: float) -> Dict[str, int]:
+def extract_rc_frames_bpf(
+    pcap_path: str, dport: int, read_buffer: int = DEFAULT_READ_BUFFER
+) -> Iterable[Tuple[int, memoryview]]:
     """
-    Count events, preventing rapid repeats. If an event label repeats within debounce_s,
-    it is considered the same continuous action and not counted again.
+    Same as extract_rc_frames, but pipes the capture through tcpdump first so the
+    "udp port N" BPF filter drops unrelated traffic in libpcap before Python reads
+    a single record. tcpdump re-emits classic pcap, so pcapng timestamps are
+    rounded to microseconds.
     """
-    counts: Dict[str, int] = {}
-    last_seen: Dict[str, float] = {}
+    cmd = ["tcpdump", "-n", "-r", pcap_path, "-w", "-", "udp", "port", str(dport)]
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, bufsize=read_buffer) as proc:
+        try:
+            yield from _rc_frames(iter_capture_frames(proc.stdout), dport)
+        except GeneratorExit:
+            proc.terminate()
+            raise
+    if proc.returncode:
+        raise RuntimeError(f"tcpdump exited with status {proc.returncode}")
+
 
-    for ts, label in events_over_time:
-        prev = last_seen.get(label)
-        if prev is None or (ts - prev) >= debounce_s:
-            counts[label] = counts.get(label, 0) + 1
-            last_seen[label] = ts
-        else:
-            # within debounce window -> ignore
+def _rc_frames(records: Iterable[Tuple[int, int, bytes]], dport: int) -> Iterable[Tuple[int, memoryview]]:
+    for ts, linktype, frame in records:
+        offset = ipv4_offset(linktype, frame)
+        if offset is None:
             continue
+        udp = udp_from_ipv4(memoryview(frame), offset)
+        if udp is None:
+            continue
+        sport, udp_dport, payload = udp
+        if udp_dport != dport and sport != dport:
+            continue
+        if len(payload) == RC_FRAME_LEN and payload[0] == 0x66 and payload[19] == 0x99:
+            yield ts, payload
+
+
+def extract_rc_frames_tshark(pcap_path: str, dport: int) -> Iterable[Tuple[int, bytes]]:
+    """
+    Same as extract_rc_frames, but lets tshark dissect the capture and apply the
+    port/length filter in C, so Python only sees matching packets as text lines
+    of "<epoch>\t<hex payload>". Handy for link types the built-in reader
+    doesn't decode.
+    """
+    cmd = [
+        "tshark", "-n", "-r", pcap_path,
+        "-Y", f"udp.port=={dport} && udp.length=={8 + RC_FRAME_LEN}",
+        "-T", "fields", "-e", "frame.time_epoch", "-e", "udp.payload",
+    ]
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE, bufsize=DEFAULT_READ_BUFFER) as proc:
+        try:
+            for line in proc.stdout:
+                ts_str, _, hex_payload = line.rstrip(b"\r\n").partition(b"\t")
+                # Tunnelled packets list one payload per UDP layer; keep the first.
+                # Older tshark releases separate the bytes with colons.
+                hex_payload = hex_payload.split(b",", 1)[0].replace(b":", b"")
+                payload = bytes.fromhex(hex_payload.decode("ascii"))
+                if len(payload) == RC_FRAME_LEN and payload[0] == 0x66 and payload[19] == 0x99:
+                    yield _epoch_to_us(ts_str), payload
+        except GeneratorExit:
+            proc.terminate()  # stopped early (--max); don't wait for the rest
+            raise
+    if proc.returncode:
+        raise RuntimeError(f"tshark exited with status {proc.returncode}")
+
+
+def _record_offsets(
+    buf: mmap.mmap, endian: str, offset: int = 24, count: int = -1, window: int = BATCH_FRAMES
+) -> Iterable[np.ndarray]:
+    # Header-only pass: yields the offsets of up to `window` complete records at
+    # a time, reading nothing but each caplen to hop to the next header.
+    caplen_at = struct.Struct(endian + "8xI")
+    end = len(buf)
+    offsets = array("q")
+    while count and offset + 16 <= end:
+        count -= 1
+        next_offset = offset + 16 + caplen_at.unpack_from(buf, offset)[0]
+        if next_offset > end:
+            break
+        offsets.append(offset)
+        offset = next_offset
+        if len(offsets) >= window:
+            yield np.frombuffer(offsets, dtype=np.int64)
+            offsets = array("q")
+    if offsets:
+        yield np.frombuffer(offsets, dtype=np.int64)
+
+
+_HEADER_BYTES = np.arange(16)
+_FRAME_BYTES = np.arange(RC_FRAME_LEN)
+
+
+def _be16(data: np.ndarray, idx: np.ndarray) -> np.ndarray:
+    return (data[idx].astype(np.int64) << 8) | data[idx + 1]
 
-    return counts
+
+def _rc_batch_from_records(
+    data: np.ndarray, records: np.ndarray, endian: str, ts_rate: int, linktype: int, dport: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized extract_rc_frames for one window of record offsets: the record
+    headers are gathered into an (n, 16) block read as four u4 columns, then
+    every link/IPv4/UDP/RC check is a mask over the surviving rows. Rows are
+    only ever filtered, never reordered, so capture order is kept.
+    """
+    hdr = data[records[:, None] + _HEADER_BYTES].view(endian + "u4").astype(np.int64)
+    sec, frac, start = hdr[:, 0], hdr[:, 1], records + 16
+    end = start + hdr[:, 2]
+
+    if linktype in (LINKTYPE_RAW, LINKTYPE_IPV4):
+        ip = start
+    elif linktype == LINKTYPE_LINUX_SLL:
+        ok = end - start >= 16
+        ip = np.where(ok, start + 16, -1)
+        ip[ok] = np.where(_be16(data, start[ok] + 14) == ETHERTYPE_IPV4, ip[ok], -1)
+    elif linktype == LINKTYPE_NULL:
+        ok = end - start >= 4
+        ip = np.full(len(records), -1, dtype=np.int64)
+        af_inet = (data[start[ok]] == 2) | (data[start[ok] + 3] == 2)
+        ip[ok] = np.where(af_inet, start[ok] + 4, -1)
+    else:  # Ethernet
+        ok = end - start >= 14
+        ip = np.full(len(records), -1, dtype=np.int64)
+        ethertype = _be16(data, start[ok] + 12)
+        ip[ok] = np.where(ethertype == ETHERTYPE_IPV4, start[ok] + 14, -1)
+        # VLAN-tagged frames are rare; let the scalar decoder unwrap the tags.
+        for i in np.flatnonzero(ok)[np.isin(ethertype, ETHERTYPE_VLAN)].tolist():
+            inner = ipv4_offset(linktype, memoryview(data[start[i] : end[i]]))
+            if inner is not None:
+                ip[i] = start[i] + inner
+
+    keep = (ip >= 0) & (ip + 20 <= end)
+    sec, frac, end, ip = sec[keep], frac[keep], end[keep], ip[keep]
+    ver_ihl = data[ip]
+    keep = (ver_ihl >> 4 == 4) & (data[ip + 9] == IPPROTO_UDP) & (_be16(data, ip + 6) & 0x1FFF == 0)
+    udp = ip[keep] + (ver_ihl[keep] & 0x0F).astype(np.int64) * 4
+    sec, frac, end = sec[keep], frac[keep], end[keep]
+
+    keep = udp + 8 <= end
+    sec, frac, end, udp = sec[keep], frac[keep], end[keep], udp[keep]
+    keep = (_be16(data, udp) == dport) | (_be16(data, udp + 2) == dport)
+    # Same UDP-length bound as udp_from_ipv4, so padding never counts as payload
+    payload_end = np.minimum(udp + np.maximum(_be16(data, udp + 4), 8), end)
+    keep &= payload_end - (udp + 8) == RC_FRAME_LEN
+    sec, frac, payload = sec[keep], frac[keep], udp[keep] + 8
+    keep = (data[payload] == 0x66) & (data[payload + 19] == 0x99)
+
+    ts = sec[keep] * US_PER_S + frac[keep] * US_PER_S // ts_rate
+    return ts, data[payload[keep][:, None] + _FRAME_BYTES]
+
+
+def _array_pcap_batches(
+    pcap_path: str, dport: int, offset: int = 24, count: int = -1, batch_frames: int = BATCH_FRAMES
+) -> Optional[Iterable[Tuple[np.ndarray, np.ndarray]]]:
+    # Batches from the vectorized reader, or None if the capture needs the
+    # scalar one (pcapng, 802.11, not mappable).
+    buf = _map_file(pcap_path)
+    header = _pcap_header(buf) if buf is not None else None
+    if header is None or header[2] not in ARRAY_LINKTYPES:
+        return None
+    endian, ts_rate, linktype = header
+    data = np.frombuffer(buf, dtype=np.uint8)
+    return (
+        _rc_batch_from_records(data, records, endian, ts_rate, linktype, dport)
+        for records in _record_offsets(buf, endian, offset, count, batch_frames)
+    )
 
 
-def extract_udp_payloads(pcap_path: str, dport: int) -> Iterable[Tuple[float, bytes]]:
+def _limit_batches(
+    batches: Iterable[Tuple[np.ndarray, np.ndarray]], max_frames: int, batch_frames: int = BATCH_FRAMES
+) -> Iterable[Tuple[np.ndarray, np.ndarray]]:
+    # Re-slice to at most batch_frames rows and stop after max_frames (0 = no limit).
+    decoded = 0
+    for ts_arr, frames in batches:
+        if max_frames:
+            ts_arr, frames = ts_arr[: max_frames - decoded], frames[: max_frames - decoded]
+        for lo in range(0, len(frames), batch_frames):
+            yield ts_arr[lo : lo + batch_frames], frames[lo : lo + batch_frames]
+        decoded += len(frames)
+        if max_frames and decoded >= max_frames:
+            return
+
+
+def split_pcap(pcap_path: str, parts: int) -> Optional[Tuple[str, int, int, List[Tuple[int, int]]]]:
     """
-    Yield (timestamp, UDP payload) from a PCAP. This expects IP/UDP packets to be present.
-    If you capture only 802.11 frames without radiotap->IP decode, ensure you're saving as PCAP
-    via tshark as recommended in the capture instructions.
+    Scan the record headers of a classic pcap once and cut it into `parts`
+    roughly equal byte ranges on record boundaries. Returns (byte order,
+    timestamp rate, linktype, [(start offset, record count), ...]), or None for
+    anything but classic pcap (pcapng blocks depend on earlier interface blocks).
     """
-    with PcapReader(pcap_path) as pcap:
-        for pkt in pcap:
-            # Scapy timestamps are on the packet
-            ts = float(getattr(pkt, "time", 0.0))
+    buf = _map_file(pcap_path)
+    header = _pcap_header(buf) if buf is not None else None
+    if header is None:
+        return None
+    endian, ts_rate, linktype = header
+    caplen_at = struct.Struct(endian + "8xI")
+
+    chunks: List[Tuple[int, int]] = []
+    start = offset = 24
+    count = 0
+    size = len(buf)
+    target = size / parts
+    while offset + 16 <= size:
+        offset += 16 + caplen_at.unpack_from(buf, offset)[0]
+        count += 1
+        if offset >= target * (len(chunks) + 1) and len(chunks) < parts - 1:
+            chunks.append((start, count))
+            start, count = offset, 0
+    if count:
+        chunks.append((start, count))
+    buf.close()
+    return endian, ts_rate, linktype, chunks
+
 
-            if IP in pkt and UDP in pkt:
-                udp = pkt[UDP]
-                if int(udp.dport) == dport or int(udp.sport) == dport:
-                    payload = bytes(udp.payload)
-                    if payload:
-                        yield ts, payload
+def _parse_pcap_chunk(task: Tuple[str, int, str, int, int, int, int]) -> Tuple[np.ndarray, np.ndarray]:
+    # Pool worker: decode one record range of a classic pcap into a batch.
+    pcap_path, dport, endian, ts_rate, linktype, start, count = task
+    batches = _array_pcap_batches(pcap_path, dport, start, count)
+    if batches is not None:
+        parts = list(batches)
+        if parts:
+            return np.concatenate([ts for ts, _ in parts]), np.concatenate([frames for _, frames in parts])
+    buf = _map_file(pcap_path)
+    timestamps = array("q")
+    raw = bytearray()
+    for ts, payload in _rc_frames(_iter_pcap_mapped(buf, endian, ts_rate, linktype, start, count), dport):
+        timestamps.append(ts)
+        raw += payload
+    return _to_batch(timestamps, raw)
+
+
+def _epoch_to_us(epoch: bytes) -> int:
+    # "1700000000.123456789" -> 1700000000123456, without a float round trip
+    sec, _, frac = epoch.partition(b".")
+    return int(sec) * US_PER_S + int(frac[:6].ljust(6, b"0"))
+
+
+def iter_frame_batches_parallel(
+    pcap_path: str,
+    dport: int,
+    jobs: int,
+    read_buffer: int = DEFAULT_READ_BUFFER,
+    max_frames: int = 0,
+    batch_frames: int = BATCH_FRAMES,
+) -> Iterable[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Like iter_frame_batches over extract_rc_frames, but parses `jobs` slices of
+    a classic pcap in worker processes. Slices come back in file order, so the
+    batches (and therefore the debounced counts) match the serial reader.
+    Captures that can't be split are read serially.
+    """
+    layout = split_pcap(pcap_path, jobs) if jobs > 1 else None
+    if layout is None or not layout[3]:
+        batches = _array_pcap_batches(pcap_path, dport, batch_frames=batch_frames)
+        if batches is None:
+            batches = iter_frame_batches(extract_rc_frames(pcap_path, dport, read_buffer), batch_frames=batch_frames)
+        yield from _limit_batches(batches, max_frames, batch_frames)
+        return
+
+    endian, ts_rate, linktype, chunks = layout
+    tasks = [(pcap_path, dport, endian, ts_rate, linktype, start, count) for start, count in chunks]
+    with multiprocessing.Pool(min(jobs, len(tasks))) as pool:
+        yield from _limit_batches(pool.imap(_parse_pcap_chunk, tasks), max_frames, batch_frames)
+
+
+def iter_frame_batches(
+    rc_frames: Iterable[Tuple[int, bytes]],
+    max_frames: int = 0,
+    batch_frames: int = BATCH_FRAMES,
+) -> Iterable[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Yield (timestamps, frames) batches from a stream of (timestamp, RC frame)
+    pairs as the capture is read, where frames is a (n, 20) uint8 matrix;
+    stops after max_frames (0 = no limit).
+    """
+    # Flat typed buffers rather than a Python object per frame; each batch is
+    # handed to NumPy without copying and a fresh pair is started.
+    timestamps = array("q")
+    raw = bytearray()
+    decoded = 0
+
+    for ts, payload in rc_frames:
+        timestamps.append(ts)
+        raw += payload
+        decoded += 1
+        if max_frames and decoded >= max_frames:
+            break
+        if len(timestamps) >= batch_frames:
+            yield _to_batch(timestamps, raw)
+            timestamps, raw = array("q"), bytearray()
+
+    if timestamps:
+        yield _to_batch(timestamps, raw)
+
+
+def _to_batch(timestamps: array, raw: bytearray) -> Tuple[np.ndarray, np.ndarray]:
+    # Zero-copy views: an int64 vector and one (n, 20) byte matrix
+    frames = np.frombuffer(raw, dtype=np.uint8).reshape(-1, RC_FRAME_LEN)
+    return np.frombuffer(timestamps, dtype=np.int64), frames
+
+
+if njit is not None:
+
+    @njit(cache=True)
+    def _u32(buf, off, big_endian):
+        if big_endian:
+            return (np.int64(buf[off]) << 24) | (np.int64(buf[off + 1]) << 16) | (np.int64(buf[off + 2]) << 8) | buf[off + 3]
+        return (np.int64(buf[off + 3]) << 24) | (np.int64(buf[off + 2]) << 16) | (np.int64(buf[off + 1]) << 8) | buf[off]
+
+    @njit(cache=True)
+    def _u16be(buf, off):
+        return (np.int64(buf[off]) << 8) | buf[off + 1]
+
+    @njit(cache=True)
+    def _count_event(code, ts, debounce_us, counts, last_seen):
+        if ts - last_seen[code] >= debounce_us:
+            counts[code] += 1
+            last_seen[code] = ts
+
+    @njit(cache=True)
+    def _fused_pcap_kernel(
+        buf, big_endian, ts_rate, linktype, dport, deadband, debounce_us, max_frames, counts, last_seen
+    ):
+        # The whole per-file pipeline in one pass over the mapped file: record
+        # walk, link/IPv4/UDP offsets, RC frame check, classify, debounce. Same
+        # rules as ipv4_offset/udp_from_ipv4/infer_event_codes, so counts match.
+        n = buf.shape[0]
+        off = 24
+        decoded = 0
+        while off + 16 <= n:
+            sec = _u32(buf, off, big_endian)
+            frac = _u32(buf, off + 4, big_endian)
+            caplen = _u32(buf, off + 8, big_endian)
+            d = off + 16
+            end = d + caplen
+            if end > n:
+                break
+            off = end
+
+            ip = -1
+            if linktype == LINKTYPE_RAW or linktype == LINKTYPE_IPV4:
+                ip = d
+            elif linktype == LINKTYPE_ETHERNET:
+                o = d + 12
+                while o + 2 <= end:
+                    ethertype = _u16be(buf, o)
+                    if ethertype == 0x8100 or ethertype == 0x88A8:
+                        o += 4
+                        continue
+                    if ethertype == ETHERTYPE_IPV4:
+                        ip = o + 2
+                    break
+            elif linktype == LINKTYPE_LINUX_SLL:
+                if caplen >= 16 and _u16be(buf, d + 14) == ETHERTYPE_IPV4:
+                    ip = d + 16
+            elif linktype == LINKTYPE_NULL:
+                if caplen >= 4 and (buf[d] == 2 or buf[d + 3] == 2):
+                    ip = d + 4
+            if ip < 0 or ip + 20 > end:
+                continue
+            if buf[ip] >> 4 != 4 or buf[ip + 9] != IPPROTO_UDP or _u16be(buf, ip + 6) & 0x1FFF:
+                continue
+            udp = ip + (buf[ip] & 0x0F) * 4
+            if udp + 8 > end:
+                continue
+            if _u16be(buf, udp) != dport and _u16be(buf, udp + 2) != dport:
+                continue
+            p = udp + 8
+            if min(udp + max(_u16be(buf, udp + 4), 8), end) - p != RC_FRAME_LEN:
+                continue
+            if buf[p] != 0x66 or buf[p + 19] != 0x99:
+                continue
+
+            ts = sec * US_PER_S + frac * US_PER_S // ts_rate
+            cmd = CMD_EVENT[buf[p + 6]]
+            if cmd != NO_EVENT:
+                _count_event(cmd, ts, debounce_us, counts, last_seen)
+            for j in range(4):
+                delta = np.int64(buf[p + 2 + AXIS_COLS[j]]) - NEUTRAL
+                if delta > deadband:
+                    _count_event(AXIS_POS[j], ts, debounce_us, counts, last_seen)
+                elif delta < -deadband:
+                    _count_event(AXIS_NEG[j], ts, debounce_us, counts, last_seen)
+            headless = HEADLESS_EVENT[buf[p + 7]]
+            if headless != NO_EVENT:
+                _count_event(headless, ts, debounce_us, counts, last_seen)
+
+            decoded += 1
+            if max_frames and decoded >= max_frames:
+                break
+        return decoded
+
+
+def process_pcap(pcap_path: str, dport: int, deadband: int, counter: EventCounter, max_frames: int = 0) -> Optional[int]:
+    """
+    Count a whole classic pcap into `counter` with one compiled pass over the
+    memory-mapped file, without building per-packet objects or batches.
+    Returns the number of RC frames decoded, or None when the fast path doesn't
+    apply (no Numba, pcapng, or an 802.11 linktype) and the regular reader
+    should be used instead.
+    """
+    if njit is None:
+        return None
+    buf = _map_file(pcap_path)
+    header = _pcap_header(buf) if buf is not None else None
+    if header is None or header[2] not in ARRAY_LINKTYPES:
+        return None
+    endian, ts_rate, linktype = header
+    data = np.frombuffer(buf, dtype=np.uint8)
+    return int(
+        _fused_pcap_kernel(
+            data, endian == ">", ts_rate, linktype, dport, deadband,
+            counter.debounce_us, max_frames, counter.counts, counter.last_seen,
+        )
+    )
+
+
+def _capture_batches(path: str, args: argparse.Namespace, max_frames: int) -> Iterable[Tuple[np.ndarray, np.ndarray]]:
+    if args.use_tshark:
+        return iter_frame_batches(extract_rc_frames_tshark(path, args.port), max_frames)
+    if args.bpf:
+        return iter_frame_batches(extract_rc_frames_bpf(path, args.port, args.read_buffer), max_frames)
+    return iter_frame_batches_parallel(path, args.port, args.jobs, args.read_buffer, max_frames)
 
 
 def main() -> int:
     ap = argparse.ArgumentParser(description="Infer drone commands from a PCAP capture.")
-    ap.add_argument("pcap", help="Path to capture file (prefer .pcap from tshark)")
+    ap.add_argument(
+        "pcap", nargs="+", help="Capture file(s) (prefer .pcap from tshark); several are counted as one session, in order"
+    )
     ap.add_argument("--port", type=int, default=8800, help="UDP control port (default: 8800)")
     ap.add_argument("--deadband", type=int, default=DEFAULT_DEADBAND, help="Neutral deadband threshold")
     ap.add_argument("--debounce", type=float, default=DEFAULT_DEBOUNCE, help="Debounce time in seconds")
     ap.add_argument("--max", type=int, default=0, help="Max frames to parse (0 = no limit)")
+    ap.add_argument(
+        "--read-buffer", type=int, default=DEFAULT_READ_BUFFER, help="Capture read buffer in bytes (default: 1 MiB)"
+    )
+    frontend = ap.add_mutually_exclusive_group()
+    frontend.add_argument(
+        "--use-tshark", action="store_true", help="Let tshark dissect and filter the capture instead of the built-in reader"
+    )
+    frontend.add_argument(
+        "--bpf", action="store_true", help="Pre-filter the capture with tcpdump's BPF 'udp port' filter"
+    )
+    ap.add_argument(
+        "--jobs", type=int, default=1, help="Parse a classic .pcap in N worker processes (default: 1)"
+    )
     ap.add_argument("--show-first", type=int, default=0, help="Print first N decoded frames for debugging")
     args = ap.parse_args()
 
-    frames: List[RCFrame] = []
+    if args.use_tshark and shutil.which("tshark") is None:
+        print("--use-tshark needs tshark on PATH (it comes with Wireshark)")
+        return 2
+    if args.bpf and shutil.which("tcpdump") is None:
+        print("--bpf needs tcpdump on PATH")
+        return 2
+
+    # One counter for every file, so a capture split across ring-buffer files
+    # (tshark -b ...) debounces across the file boundaries like a single one.
+    counter = EventCounter(args.debounce)
     decoded = 0
+    # Only the frames --show-first asks for are kept once their batch is done.
+    shown_ts: List[np.ndarray] = []
+    shown_frames: List[np.ndarray] = []
+    n_shown = 0
 
-    for ts, payload in extract_udp_payloads(args.pcap, args.port):
-        f = parse_rc_frame(ts, payload)
-        if not f:
-            continue
-        frames.append(f)
-        decoded += 1
+    for path in args.pcap:
         if args.max and decoded >= args.max:
             break
+        remaining = args.max - decoded if args.max else 0
+        if not (args.use_tshark or args.bpf or args.show_first or args.jobs > 1):
+            # Nothing needs the decoded frames themselves, only the counts.
+            fused = process_pcap(path, args.port, args.deadband, counter, remaining)
+            if fused is not None:
+                decoded += fused
+                continue
+        for ts_arr, frames in _capture_batches(path, args, remaining):
+            if n_shown < args.show_first:
+                keep = args.show_first - n_shown
+                shown_ts.append(ts_arr[:keep])
+                shown_frames.append(frames[:keep].copy())
+                n_shown += len(shown_frames[-1])
+            decoded += len(frames)
+
+            rows, codes = infer_event_codes(frames, args.deadband)
+            counter.add(ts_arr[rows], codes)
 
-    if not frames:
+    if not decoded:
         print("No RC frames found.")
         print("Tips:")
         print("- Confirm capture contains IP/UDP packets (recommend capturing with: tshark -I -i wlan0mon ... -w session.pcap)")
         print("- Try changing --port if your drone uses a different port")
         return 2
 
+    # The report is assembled first and written once instead of a print (and
+    # possibly a flush) per line; --show-first can be thousands of lines.
+    out: List[str] = []
+
     if args.show_first:
-        print(f"First {min(args.show_first, len(frames))} frames:")
-        for f in frames[: args.show_first]:
-            print(
-                f"t={f.ts:.3f} roll={f.roll:3d} pitch={f.pitch:3d} thr={f.throttle:3d} yaw={f.yaw:3d} "
-                f"cmd=0x{f.cmd:02x} headless=0x{f.headless:02x} raw={f.raw.hex()}"
-            )
-        print()
-
-    # Convert frames to event stream
-    event_stream: List[Tuple[float, str]] = []
-    for f in frames:
-        labels = infer_event(f, args.deadband)
-        for label in labels:
-            event_stream.append((f.ts, label))
-
-    counts = debounce_and_count(event_stream, args.debounce)
-
-    # Print summary
-    print(f"Decoded RC frames: {len(frames)}")
-    print(f"UDP port: {args.port}")
-    print(f"Deadband: ±{args.deadband} around {NEUTRAL} (0x{NEUTRAL:02x})")
-    print(f"Debounce: {args.debounce:.2f}s")
-    print()
+        raw = np.concatenate(shown_frames)
+        rc = raw.view(RC_FRAME_DTYPE)[:, 0]
+        raw_hex = raw.tobytes().hex()
+        hex_len = 2 * RC_FRAME_LEN
+        fields = zip(
+            np.concatenate(shown_ts).tolist(),
+            rc["roll"].tolist(), rc["pitch"].tolist(), rc["throttle"].tolist(), rc["yaw"].tolist(),
+            rc["cmd"].tolist(), rc["headless"].tolist(),
+        )
+        out.append(f"First {n_shown} frames:")
+        out.extend(
+            f"t={t / US_PER_S:.3f} roll={roll:3d} pitch={pitch:3d} thr={throttle:3d} yaw={yaw:3d} "
+            f"cmd=0x{cmd:02x} headless=0x{headless:02x} raw={raw_hex[i * hex_len : (i + 1) * hex_len]}"
+            for i, (t, roll, pitch, throttle, yaw, cmd, headless) in enumerate(fields)
+        )
+        out.append("")
+
+    counts = counter.by_label()
+
+    # Summary
+    out.append(f"Decoded RC frames: {decoded}")
+    out.append(f"UDP port: {args.port}")
+    out.append(f"Deadband: ±{args.deadband} around {NEUTRAL} (0x{NEUTRAL:02x})")
+    out.append(f"Debounce: {args.debounce:.2f}s")
+    out.append("")
 
     # Nice ordering: commands first, then axes
     preferred_order = [
@@ -231,14 +1073,15 @@ def main() -> int:
     printed = set()
     for k in preferred_order:
         if k in counts:
-            print(f"{k:16s} x{counts[k]}")
+            out.append(f"{k:16s} x{counts[k]}")
             printed.add(k)
 
-    # Print any other unknown codes encountered
+    # Any other unknown codes encountered
     for k in sorted(counts.keys()):
         if k not in printed:
-            print(f"{k:16s} x{counts[k]}")
+            out.append(f"{k:16s} x{counts[k]}")
 
+    sys.stdout.write("\n".join(out) + "\n")
     return 0
 
 